@@ -2,19 +2,27 @@ import argparse
 import hashlib
 import logging
 import os
+import random
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 BASE_SEARCH_URL = "https://mba.globis.ac.jp/about_mba/glossary/search.html"
 
+# 全カテゴリ合計でのページ取得同時実行数と、カテゴリ内の投機的先読みページ数。
+# ページ総数は事前に分からないため、次のバッチをまとめて取得し、
+# 空ページ/同一内容ページが出た時点で残りを打ち切る。
+PAGE_FETCH_CONCURRENCY = 8
+PAGE_PREFETCH_BATCH = 4
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; GLOBIS-GlossaryFetcher/3.0; +https://mba.globis.ac.jp)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -42,14 +50,8 @@ CATEGORIES: Sequence[Category] = (
 
 
 def _uniq_keep_order(items: Iterable[str]) -> List[str]:
-    seen: Set[str] = set()
-    out: List[str] = []
-    for item in items:
-        if item in seen:
-            continue
-        seen.add(item)
-        out.append(item)
-    return out
+    # dictは挿入順を保持するため、C実装のfromkeysだけで順序保存の重複排除になる
+    return list(dict.fromkeys(items))
 
 
 def _page_fingerprint(terms: Sequence[str], hrefs: Sequence[str]) -> str:
@@ -57,29 +59,82 @@ def _page_fingerprint(terms: Sequence[str], hrefs: Sequence[str]) -> str:
     return hashlib.sha256(payload).hexdigest()
 
 
-def _build_session(*, verify_tls: bool, no_env_proxy: bool) -> requests.Session:
+class _FullJitterRetry(Retry):
+    """指数バックオフに全ジッタ(0〜指数値の一様乱数)を加えたRetry。
+
+    既定の backoff_factor * 2^(n-1) は決定的で、並列クロール時に429を受けた
+    ワーカーが一斉に同じタイミングで再試行する(thundering herd)。全ジッタで
+    再試行時刻を散らし、上限はBACKOFF_CAP秒に抑える。429/503のRetry-After
+    ヘッダはurllib3が既定で優先する(respect_retry_after_header)。
+    """
+
+    # Retryは再試行ごとに .new() で作り直されインスタンス属性が引き継がれないため、
+    # 上限はクラス属性で持つ(セッションは1プロセス1回しか構築しない)
+    BACKOFF_CAP = 30.0
+
+    def get_backoff_time(self) -> float:
+        base = super().get_backoff_time()
+        if base <= 0:
+            return 0.0
+        return random.uniform(0.0, min(base, self.BACKOFF_CAP))
+
+
+def _build_session(
+    *,
+    verify_tls: bool,
+    no_env_proxy: bool,
+    max_retries: int,
+    backoff_base: float,
+    backoff_cap: float,
+) -> requests.Session:
     session = requests.Session()
     session.headers.update(HEADERS)
     session.verify = verify_tls
     if no_env_proxy:
         session.trust_env = False
 
-    retry = Retry(
-        total=6,
+    _FullJitterRetry.BACKOFF_CAP = backoff_cap
+    retry = _FullJitterRetry(
+        total=max_retries,
         connect=3,
         read=3,
-        status=6,
-        backoff_factor=0.8,
+        status=max_retries,
+        backoff_factor=backoff_base,
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=frozenset({"GET"}),
         raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    # カテゴリ並列クロールで全ワーカーが同一ホストを叩くため、プールは同時実行数より余裕を持たせる。
+    # pool_block=True でプール上限超過時に接続を作って捨てる(=TLS再ハンドシェイク)のを防ぎ、
+    # 1接続をページ間で確実に使い回す。
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=len(CATEGORIES),
+        pool_maxsize=len(CATEGORIES) * 2,
+        pool_block=True,
     )
-    adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
 
 
+def _log_keepalive_stats(session: requests.Session, logger: logging.Logger) -> None:
+    """keep-aliveによる接続の使い回しが効いているかを実測でログに残す。
+
+    urllib3のプールはリクエスト数と新規接続数を数えているので、
+    new_connections がリクエスト数より十分小さければ再利用できている。
+    (プロキシ環境等で内部構造が異なる場合は黙ってスキップ)
+    """
+    try:
+        pools = list(session.get_adapter("https://").poolmanager.pools._container.values())
+    except Exception:
+        return
+    num_requests = sum(getattr(p, "num_requests", 0) for p in pools)
+    num_connections = sum(getattr(p, "num_connections", 0) for p in pools)
+    logger.info("keepalive requests=%d new_connections=%d pools=%d", num_requests, num_connections, len(pools))
+
+
 def _configure_logger(log_path: str) -> logging.Logger:
     logger = logging.getLogger("globis_glossary")
     logger.setLevel(logging.INFO)
@@ -95,21 +150,32 @@ def _configure_logger(log_path: str) -> logging.Logger:
     return logger
 
 
-def _extract_terms_from_results(soup: BeautifulSoup) -> Tuple[List[str], List[str]]:
+_XPATH_RESULT_LINKS = (
+    "//a[contains(concat(' ', normalize-space(@class), ' '), ' no_underline ')"
+    " and contains(concat(' ', normalize-space(@class), ' '), ' border ')"
+    " and starts-with(@href, 'detail-')]"
+)
+_XPATH_RESULT_LINKS_FALLBACK = "//a[starts-with(@href, 'detail-')]"
+
+
+def _extract_terms_from_results(html: str) -> Tuple[List[str], List[str]]:
     terms: List[str] = []
     hrefs: List[str] = []
 
+    tree = lxml.html.fromstring(html)
+
     # 検索結果の用語リンクは href="detail-xxxxx.html" になる(アクセストップ10等は /about_mba/... なので除外できる)
-    candidates = soup.select("a.no_underline.border[href^='detail-']")
+    candidates = tree.xpath(_XPATH_RESULT_LINKS)
     if not candidates:
-        candidates = soup.select("a[href^='detail-']")
+        candidates = tree.xpath(_XPATH_RESULT_LINKS_FALLBACK)
 
     for a in candidates:
         href = (a.get("href") or "").strip()
         if not href:
             continue
-        h3 = a.select_one("h3")
-        text = h3.get_text(" ", strip=True) if h3 else a.get_text(" ", strip=True)
+        h3 = a.find(".//h3")
+        el = a if h3 is None else h3
+        text = " ".join(el.text_content().split())
         if "カテゴリー：" in text:
             text = text.split("カテゴリー：", 1)[0].strip()
         if not text:
@@ -144,10 +210,35 @@ def _fetch_page(
         raise
 
 
+def _category_page_url(category: Category, page: int) -> str:
+    params: Dict[str, str] = {"category": str(category.category_id)}
+    if page > 0:
+        params["page"] = str(page)
+    return f"{BASE_SEARCH_URL}?{urlencode(params)}"
+
+
+def _fetch_category_page(
+    session: requests.Session,
+    category: Category,
+    page: int,
+    *,
+    timeout_sec: float,
+    sleep_sec: float,
+    logger: logging.Logger,
+) -> str:
+    # サーバ負荷の平準化: 同時リクエストが一斉に刺さらないようスリープにジッタを入れる
+    if sleep_sec > 0:
+        time.sleep(random.uniform(0.5 * sleep_sec, 1.5 * sleep_sec))
+    url = _category_page_url(category, page)
+    context = f"category={category.category_id} page={page}"
+    return _fetch_page(session, url, timeout_sec=timeout_sec, logger=logger, context=context)
+
+
 def _crawl_category(
     session: requests.Session,
     category: Category,
     *,
+    fetch_executor: ThreadPoolExecutor,
     timeout_sec: float,
     sleep_sec: float,
     max_pages: int,
@@ -157,33 +248,50 @@ def _crawl_category(
     prev_fp: Optional[str] = None
 
     page = 0
-    while page < max_pages:
-        params: Dict[str, str] = {"category": str(category.category_id)}
-        if page > 0:
-            params["page"] = str(page)
-        url = f"{BASE_SEARCH_URL}?{urlencode(params)}"
-        context = f"category={category.category_id} page={page}"
-
-        html = _fetch_page(session, url, timeout_sec=timeout_sec, logger=logger, context=context)
-        soup = BeautifulSoup(html, "lxml")
-        terms, hrefs = _extract_terms_from_results(soup)
-
-        logger.info("%s url=%s terms=%d", context, url, len(terms))
-
-        if not terms:
-            logger.info("%s stop=empty", context)
-            break
-
-        fp = _page_fingerprint(terms, hrefs)
-        if prev_fp is not None and fp == prev_fp:
-            logger.warning("%s stop=duplicate_page", context)
-            break
-        prev_fp = fp
-
-        all_terms.extend(terms)
-        page += 1
-        if sleep_sec > 0:
-            time.sleep(sleep_sec)
+    stopped = False
+    while page < max_pages and not stopped:
+        batch = range(page, min(page + PAGE_PREFETCH_BATCH, max_pages))
+        futures: List[Tuple[int, Future]] = [
+            (
+                p,
+                fetch_executor.submit(
+                    _fetch_category_page,
+                    session,
+                    category,
+                    p,
+                    timeout_sec=timeout_sec,
+                    sleep_sec=sleep_sec,
+                    logger=logger,
+                ),
+            )
+            for p in batch
+        ]
+
+        for p, future in futures:
+            context = f"category={category.category_id} page={p}"
+            if stopped:
+                future.cancel()
+                continue
+
+            html = future.result()
+            terms, hrefs = _extract_terms_from_results(html)
+
+            logger.info("%s url=%s terms=%d", context, _category_page_url(category, p), len(terms))
+
+            if not terms:
+                logger.info("%s stop=empty", context)
+                stopped = True
+                continue
+
+            fp = _page_fingerprint(terms, hrefs)
+            if prev_fp is not None and fp == prev_fp:
+                logger.warning("%s stop=duplicate_page", context)
+                stopped = True
+                continue
+            prev_fp = fp
+
+            all_terms.extend(terms)
+            page = p + 1
 
     if page >= max_pages:
         logger.warning("category=%s stop=max_pages max_pages=%d", category.category_id, max_pages)
@@ -199,6 +307,9 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     p.add_argument("--sleep", type=float, default=0.4, help="ページ間スリープ秒")
     p.add_argument("--timeout", type=float, default=60.0, help="HTTPタイムアウト秒")
     p.add_argument("--max-pages", type=int, default=300, help="カテゴリあたりの最大ページ数(暴走防止)")
+    p.add_argument("--max-retries", type=int, default=6, help="HTTPリトライ回数の上限")
+    p.add_argument("--backoff-base", type=float, default=0.8, help="リトライ指数バックオフの基準秒")
+    p.add_argument("--backoff-cap", type=float, default=30.0, help="リトライ待ち時間の上限秒")
     p.add_argument(
         "--insecure",
         action="store_true",
@@ -213,31 +324,54 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     logger = _configure_logger(args.log)
 
     verify_tls = not args.insecure
-    session = _build_session(verify_tls=verify_tls, no_env_proxy=args.no_env_proxy)
+    session = _build_session(
+        verify_tls=verify_tls,
+        no_env_proxy=args.no_env_proxy,
+        max_retries=args.max_retries,
+        backoff_base=args.backoff_base,
+        backoff_cap=args.backoff_cap,
+    )
 
     logger.info(
         "start output=%s log=%s insecure=%s no_env_proxy=%s", args.output, args.log, args.insecure, args.no_env_proxy
     )
-    all_terms: List[str] = []
+    # カテゴリ横断の重複排除は収集しながら1パスで行う(結合リストを作って後から走査しない)
+    uniq_all: Dict[str, None] = {}
+    terms_total = 0
+
+    # クロールはネットワークI/O待ちが支配的なので、カテゴリ単位で並列化しつつ、
+    # ページ取得は全カテゴリ共有のプールで(category, page)単位に束ねて同時実行数を制限する。
+    # 結果はCATEGORIES順に回収し、出力順の決定性を保つ(sleep_secは各取得前に独立に効く)。
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY) as fetch_executor:
 
-    for category in CATEGORIES:
-        logger.info("category_start id=%s name=%s", category.category_id, category.name)
-        try:
+        def _crawl_one(category: Category) -> List[str]:
+            logger.info("category_start id=%s name=%s", category.category_id, category.name)
             terms = _crawl_category(
                 session,
                 category,
+                fetch_executor=fetch_executor,
                 timeout_sec=args.timeout,
                 sleep_sec=args.sleep,
                 max_pages=args.max_pages,
                 logger=logger,
             )
             logger.info("category_done id=%s terms=%d", category.category_id, len(terms))
-            all_terms.extend(terms)
-        except Exception as e:
-            logger.exception("category_failed id=%s name=%s error=%s", category.category_id, category.name, repr(e))
-            continue
-
-    uniq_all = _uniq_keep_order(all_terms)
+            return terms
+
+        with ThreadPoolExecutor(max_workers=len(CATEGORIES)) as executor:
+            futures = {category: executor.submit(_crawl_one, category) for category in CATEGORIES}
+            for category in CATEGORIES:
+                try:
+                    terms = futures[category].result()
+                    terms_total += len(terms)
+                    uniq_all.update(dict.fromkeys(terms))
+                except Exception as e:
+                    logger.exception(
+                        "category_failed id=%s name=%s error=%s", category.category_id, category.name, repr(e)
+                    )
+                    continue
+
+    _log_keepalive_stats(session, logger)
 
     os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
     with open(args.output, "w", encoding="utf-8-sig", newline="\n") as f:
@@ -245,7 +379,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             f.write(t)
             f.write("\n")
 
-    logger.info("done categories=%d terms_total=%d terms_unique=%d", len(CATEGORIES), len(all_terms), len(uniq_all))
+    logger.info("done categories=%d terms_total=%d terms_unique=%d", len(CATEGORIES), terms_total, len(uniq_all))
     return 0
 
 
@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
+import os
 import re
 import shutil
+import threading
 import unicodedata
 from collections import Counter
-from contextlib import redirect_stderr, redirect_stdout
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import StringIO
 from pathlib import Path
+from queue import Full, Queue
 
-from janome.tokenizer import Tokenizer
+try:
+    import fugashi
+except Exception:  # pragma: no cover
+    fugashi = None
+
+try:
+    from janome.tokenizer import Tokenizer
+except Exception:  # pragma: no cover
+    Tokenizer = None
+
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover
+    ahocorasick = None
+
+try:
+    import pypdfium2 as pdfium
+except Exception:  # pragma: no cover
+    pdfium = None
 
 try:
     from pdfminer.high_level import extract_text as pdfminer_extract_text
@@ -30,15 +55,64 @@ RESOURCES_DIR = ROOT_DIR / "resources"
 OUTPUT_DIR = ROOT_DIR / "output"
 WORDLIST_DIR = ROOT_DIR / "wordList"
 WORKLOG_DIR = ROOT_DIR / "worklog"
+CACHE_DIR = ROOT_DIR / ".cache" / "candidates"
+# 候補抽出ロジック(extract_candidates周り)を変えたら上げる。キャッシュキーに入り、
+# 旧バージョンのエントリを無効化する
+_CACHE_VERSION = 2
 
 MAX_TERMS_PER_COMPANY = 10_000
 MAX_TERM_CHARS = 40
 MIN_TERM_CHARS = 2
 
-TOKENIZER = Tokenizer()
-
 logging.getLogger("pypdf").setLevel(logging.ERROR)
 
+
+@functools.cache
+def _resolved_backend() -> str:
+    backend = os.environ.get("MR_INSIGHT_TOKENIZER", "").strip().lower()
+    if backend not in {"janome", "fugashi"}:
+        backend = "fugashi" if fugashi is not None else "janome"
+    return backend
+
+
+@functools.cache
+def _token_stream():
+    """行テキストを (surface, 品詞1, 品詞2) の列へ変換する関数を返す。
+
+    純Pythonのjanomeより1桁速いfugashi(MeCabバインディング)を優先し、
+    環境変数 MR_INSIGHT_TOKENIZER=janome|fugashi で明示切り替えできる。
+    辞書ロードが重いため遅延初期化し、企業単位の並列実行では
+    各ワーカープロセスが最初の利用時に1回だけロードする。
+    """
+    backend = _resolved_backend()
+
+    if backend == "fugashi":
+        if fugashi is None:
+            raise RuntimeError("fugashi が見つかりません（MR_INSIGHT_TOKENIZER=janome で代替可能）")
+        tagger = fugashi.Tagger()
+
+        def stream(line: str):
+            # MeCabは空白をトークンとして出さず直後の語のwhite_spaceに吸収する。
+            # janomeは空白を(記号,空白)トークンとして出しセグメントを切るため、
+            # 同じ境界になるよう空白トークンを明示的に補って流す
+            for word in tagger(line):
+                if word.white_space:
+                    yield word.white_space, "記号", "空白"
+                yield word.surface, word.feature.pos1 or "", word.feature.pos2 or ""
+
+        return stream
+
+    if Tokenizer is None:
+        raise RuntimeError("トークナイザが見つかりません（fugashi または janome が必要）")
+    tokenizer = Tokenizer()
+
+    def stream(line: str):
+        for token in tokenizer.tokenize(line):
+            pos = token.part_of_speech.split(",")
+            yield token.surface, pos[0] if pos else "", pos[1] if len(pos) > 1 else ""
+
+    return stream
+
 STOPWORDS = {
     "当社",
     "本書",
@@ -58,13 +132,14 @@ STOPWORDS = {
 CONNECTORS = {"・", "-", "－", "‐", "/", "／"}
 
 
-RE_ONLY_DIGITS = re.compile(r"^\d+$")
-RE_ONLY_NUM_PUNCT = re.compile(r"^[\d,.\-–—ー]+$")
-RE_ONLY_HIRAGANA = re.compile(r"^[ぁ-ゖ]+$")
-RE_DATE_LIKE = re.compile(
-    r"^(?:\d{4}年\d{1,2}月\d{1,2}日|\d{4}/\d{1,2}/\d{1,2}|\d{4}-\d{1,2}-\d{1,2})$"
+# 数値のみ/数値+記号/ひらがなのみ/日付/章番号の各fullmatchを1本の選択肢にまとめる
+# (_looks_badは候補語ごとに呼ばれるため、正規表現エンジンへの往復を1回に抑える)
+RE_BAD_FULLMATCH = re.compile(
+    r"(?:[\d,.\-–—ー]+"
+    r"|[ぁ-ゖ]+"
+    r"|\d{4}年\d{1,2}月\d{1,2}日|\d{4}/\d{1,2}/\d{1,2}|\d{4}-\d{1,2}-\d{1,2}"
+    r"|第?\d+(?:章|節|項|期)|\d+(?:章|節|項))"
 )
-RE_SECTION_LIKE = re.compile(r"^(?:第?\d+(?:章|節|項|期)|\d+(?:章|節|項))$")
 
 
 @dataclass(frozen=True)
@@ -82,49 +157,64 @@ def _nfkc(text: str) -> str:
     return unicodedata.normalize("NFKC", text)
 
 
+# NBSP/全角スペースの置換はC実装のtranslate1パスにまとめる(ページあたり数百KBを何度も走査しない)
+_CLEAN_TRANS = str.maketrans({"\u00a0": " ", "\u3000": " "})
+RE_SPACES = re.compile(r"[ \t]+")
+
+
 def _clean_text(text: str) -> str:
-    text = _nfkc(text)
-    text = text.replace("\u00a0", " ").replace("\u3000", " ")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\r\n?", "\n", text)
+    text = _nfkc(text).translate(_CLEAN_TRANS)
+    text = RE_SPACES.sub(" ", text)
+    # \r\n → \n\n になってしまうためtranslateでは扱えない。\r を含むページ自体が稀なので
+    # 存在チェックで丸ごとスキップする
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
     return text
 
 
-def extract_pdf_pages_text(pdf_path: Path) -> tuple[list[str], PdfInfo]:
+def iter_pdf_pages_text(pdf_path: Path) -> Iterator[str]:
+    """PDFの各ページ本文を1ページずつyieldする。
+
+    文書全体の文字列を同時に保持しないため、数百ページの報告書でも
+    メモリはページ1枚分+αで済む。ページ数等の集計は呼び出し側で行う。
+    """
+    if pdfium is not None:
+        # PDFium(C++)はpdfminerより桁違いに速く、日本語PDFの抽出精度も同等。
+        # stderrに警告を吐かないのでredirectも不要。ページハンドルはyield後に都度解放する。
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                try:
+                    raw = textpage.get_text_range() or ""
+                finally:
+                    textpage.close()
+                    page.close()
+                yield _clean_text(raw).strip()
+        finally:
+            pdf.close()
+        return
+
     if pdfminer_extract_text is not None:
-        # pdfminer は日本語PDFの抽出精度が高く、抽出禁止メタデータの警告も出るため抑制する
+        # pdfminer は日本語PDFの抽出精度が高く、抽出禁止メタデータの警告も出るため抑制する。
+        # high-level APIは文書単位でしか抽出できないので、このフォールバックのみ一括抽出後に順次返す。
         with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
             raw_all = pdfminer_extract_text(str(pdf_path)) or ""
-        pages = [_clean_text(p).strip() for p in raw_all.split("\f")]
-        pages_text = [p for p in pages if p is not None]
-        pages_with_text = sum(1 for p in pages_text if p)
-        return pages_text, PdfInfo(
-            path=pdf_path,
-            pages_total=len(pages_text),
-            pages_with_text=pages_with_text,
-        )
+        for p in raw_all.split("\f"):
+            yield _clean_text(p).strip()
+        return
 
     if PdfReader is None:  # pragma: no cover
-        raise RuntimeError("PDFテキスト抽出ライブラリが見つかりません（pdfminer.six または pypdf が必要）")
+        raise RuntimeError(
+            "PDFテキスト抽出ライブラリが見つかりません（pypdfium2 / pdfminer.six / pypdf のいずれかが必要）"
+        )
 
     with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
         reader = PdfReader(str(pdf_path))
-    pages_text: list[str] = []
-    pages_with_text = 0
-
     for page in reader.pages:
         with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
             raw = page.extract_text() or ""
-        cleaned = _clean_text(raw).strip()
-        pages_text.append(cleaned)
-        if cleaned:
-            pages_with_text += 1
-
-    return pages_text, PdfInfo(
-        path=pdf_path,
-        pages_total=len(reader.pages),
-        pages_with_text=pages_with_text,
-    )
+        yield _clean_text(raw).strip()
 
 
 def _is_termish_surface(surface: str) -> bool:
@@ -137,40 +227,18 @@ def _is_termish_surface(surface: str) -> bool:
     return False
 
 
-def _is_noun_token(token) -> bool:
-    pos = token.part_of_speech.split(",")
-    pos1 = pos[0] if len(pos) > 0 else ""
-    pos2 = pos[1] if len(pos) > 1 else ""
+# IPA辞書(janome)の品詞2と、UniDic系(fugashi)の対応する品詞2を両方除外する
+_NON_TERM_POS2 = {"数", "数詞", "非自立", "非自立可能", "代名詞", "接尾", "接尾辞"}
+
 
+def _is_noun_pos(pos1: str, pos2: str) -> bool:
     if pos1 != "名詞":
         return False
-    if pos2 in {"数", "非自立", "代名詞", "接尾"}:
+    if pos2 in _NON_TERM_POS2:
         return False
     return True
 
 
-def _iter_term_sequences(text: str) -> list[list[str]]:
-    seq: list[str] = []
-    sequences: list[list[str]] = []
-
-    for offset in range(0, len(text), 10_000):
-        chunk = text[offset : offset + 10_000]
-        for token in TOKENIZER.tokenize(chunk):
-            surface = token.surface
-            if _is_noun_token(token) or _is_termish_surface(surface):
-                seq.append(surface)
-                continue
-
-            if seq:
-                sequences.append(seq)
-                seq = []
-
-    if seq:
-        sequences.append(seq)
-
-    return sequences
-
-
 def _join_surfaces(surfaces: list[str]) -> str:
     return "".join(surfaces).strip()
 
@@ -201,12 +269,17 @@ def extract_candidates(text: str) -> list[str]:
     segment: list[str] = []
     kinds: list[str] = []
 
-    for offset in range(0, len(text), 10_000):
-        chunk = text[offset : offset + 10_000]
-        for token in TOKENIZER.tokenize(chunk):
-            surface = token.surface
+    # 10,000文字ごとの機械的な分割はトークンを途中で切るうえ、トークナイザ呼び出し回数も増える。
+    # _clean_text 済みテキストは改行区切りなので、行単位でそのままトークナイザに流す。
+    # 従来は改行が空白トークン(記号,空白)として連接を切っていたため、
+    # 各行の末尾で必ずセグメントをflushして行をまたぐ連接を作らない。
+    tokenize = _token_stream()
+    for line in text.split("\n"):
+        if not line.strip():
+            continue
+        for surface, pos1, pos2 in tokenize(line):
             kind = None
-            if _is_noun_token(token):
+            if _is_noun_pos(pos1, pos2):
                 kind = "noun"
             elif _is_termish_surface(surface):
                 kind = "noun" if re.fullmatch(r"[A-Za-z0-9]+", surface) else "connector"
@@ -220,10 +293,44 @@ def extract_candidates(text: str) -> list[str]:
             segment.append(surface)
             kinds.append(kind)
 
-    flush_segment(segment, kinds)
+        flush_segment(segment, kinds)
+        segment = []
+        kinds = []
+
+    return candidates
+
+
+def _cached_extract_candidates(page_text: str) -> list[str]:
+    """extract_candidates のディスクキャッシュ付きラッパー。
+
+    IR資料は表紙・目次・免責事項など同一ページが資料をまたいで繰り返されるうえ、
+    フィルタ調整での再実行も多い。ページ本文のblake2bをキーに候補語リストを
+    `.cache/candidates/` に保存し、ヒット時はトークナイズを丸ごと省略する。
+    キーごとに別ファイルなのでプロセス並列でも安全(書き込みはtmp→renameで原子的)。
+    候補語はトークナイザバックエンドと抽出ロジックの版にも依存するため、
+    両者をキーに混ぜて別環境・旧コードのエントリを拾わないようにする。
+    """
+    salted = f"{_CACHE_VERSION}:{_resolved_backend()}:{page_text}"
+    key = hashlib.blake2b(salted.encode("utf-8"), digest_size=16).hexdigest()
+    cache_path = CACHE_DIR / key[:2] / f"{key}.json"
+    if cache_path.exists():
+        try:
+            return json.loads(cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            pass  # 壊れたキャッシュは作り直す
+
+    candidates = extract_candidates(page_text)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(candidates, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass  # キャッシュ保存の失敗は本処理に影響させない
     return candidates
 
 
+@functools.lru_cache(maxsize=200_000)
 def _looks_bad(term: str, company: str) -> bool:
     if not term:
         return True
@@ -238,19 +345,7 @@ def _looks_bad(term: str, company: str) -> bool:
     if term in STOPWORDS:
         return True
 
-    if RE_ONLY_DIGITS.fullmatch(term):
-        return True
-
-    if RE_ONLY_NUM_PUNCT.fullmatch(term):
-        return True
-
-    if RE_ONLY_HIRAGANA.fullmatch(term):
-        return True
-
-    if RE_DATE_LIKE.fullmatch(term):
-        return True
-
-    if RE_SECTION_LIKE.fullmatch(term):
+    if RE_BAD_FULLMATCH.fullmatch(term):
         return True
 
     if "http" in term.lower():
@@ -300,74 +395,89 @@ def _extract_context(text: str, term: str) -> str | None:
     return window
 
 
+# conceptType/categoryのマーカー集合。1語に対し集合ごとの部分一致走査を繰り返す代わりに、
+# 全マーカーを1つのAho-Corasickオートマトンに載せて1回の走査でヒットした集合名を得る
+# (pyahocorasick不在時は集合ごとの選択肢正規表現にフォールバック)。
+_MARKER_BUCKETS: dict[str, tuple[str, ...]] = {
+    "metric": ("高", "額", "利益", "損失", "収益", "売上", "費", "コスト", "率", "比率", "件数",
+               "人数", "数量", "単価", "KPI", "ROE", "ROA", "EBITDA", "EPS", "PER", "PBR", "CF", "FCF"),
+    "event": ("減損", "買収", "合併", "取得", "売却", "訴訟", "計上", "発生", "適用"),
+    "structure": ("セグメント", "方針", "戦略", "計画", "モデル", "システム", "プロセス", "体制",
+                  "ガバナンス", "内部統制"),
+    "entity": ("委員会", "グループ", "子会社", "連結子会社", "部", "本部", "室", "会"),
+    "pl": ("売上", "利益", "収益", "費用", "原価", "営業", "経常"),
+    "bs": ("資産", "負債", "純資産", "のれん", "株主資本"),
+    "cf": ("キャッシュ",),
+    "risk": ("リスク",),
+    "governance": ("ガバナンス", "内部統制", "コンプライアンス"),
+    "business": ("セグメント", "KPI", "事業", "顧客", "戦略"),
+}
+
+
+def _build_marker_automaton():
+    if ahocorasick is None:
+        return None
+    buckets_by_marker: dict[str, set[str]] = {}
+    for bucket, markers in _MARKER_BUCKETS.items():
+        for marker in markers:
+            buckets_by_marker.setdefault(marker, set()).add(bucket)
+    automaton = ahocorasick.Automaton()
+    for marker, buckets in buckets_by_marker.items():
+        automaton.add_word(marker, frozenset(buckets))
+    automaton.make_automaton()
+    return automaton
+
+
+_MARKER_AUTOMATON = _build_marker_automaton()
+_MARKER_RES = {
+    bucket: re.compile("|".join(map(re.escape, markers)))
+    for bucket, markers in _MARKER_BUCKETS.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _marker_hits(term: str) -> frozenset[str]:
+    if _MARKER_AUTOMATON is not None:
+        hits: set[str] = set()
+        for _, buckets in _MARKER_AUTOMATON.iter(term):
+            hits.update(buckets)
+        return frozenset(hits)
+    return frozenset(bucket for bucket, regex in _MARKER_RES.items() if regex.search(term))
+
+
+@functools.lru_cache(maxsize=None)
 def _concept_type(term: str) -> str:
-    metric_markers = (
-        "高",
-        "額",
-        "利益",
-        "損失",
-        "収益",
-        "売上",
-        "費",
-        "コスト",
-        "率",
-        "比率",
-        "件数",
-        "人数",
-        "数量",
-        "単価",
-        "KPI",
-        "ROE",
-        "ROA",
-        "EBITDA",
-        "EPS",
-        "PER",
-        "PBR",
-        "CF",
-        "FCF",
-    )
-    event_markers = ("減損", "買収", "合併", "取得", "売却", "訴訟", "計上", "発生", "適用")
-    structure_markers = (
-        "セグメント",
-        "方針",
-        "戦略",
-        "計画",
-        "モデル",
-        "システム",
-        "プロセス",
-        "体制",
-        "ガバナンス",
-        "内部統制",
-    )
-    entity_markers = ("委員会", "グループ", "子会社", "連結子会社", "部", "本部", "室", "会")
-
-    if any(m in term for m in metric_markers):
+    hits = _marker_hits(term)
+    if "metric" in hits:
         return "Metric"
-    if any(m in term for m in event_markers):
+    if "event" in hits:
         return "Event"
-    if any(m in term for m in structure_markers):
+    if "structure" in hits:
         return "Structure"
-    if any(m in term for m in entity_markers):
+    if "entity" in hits:
         return "Entity"
     return "Other"
 
 
+@functools.lru_cache(maxsize=None)
 def _category(term: str) -> str | None:
-    if any(k in term for k in ("売上", "利益", "収益", "費用", "原価", "営業", "経常")):
+    hits = _marker_hits(term)
+    if "pl" in hits:
         return "PL"
-    if any(k in term for k in ("資産", "負債", "純資産", "のれん", "株主資本")):
+    if "bs" in hits:
         return "BS"
-    if "キャッシュ" in term or term.endswith("CF") or "キャッシュ・フロー" in term:
+    if "cf" in hits or term.endswith("CF"):
         return "CF"
-    if "リスク" in term:
+    if "risk" in hits:
         return "Risk"
-    if any(k in term for k in ("ガバナンス", "内部統制", "コンプライアンス")):
+    if "governance" in hits:
         return "Governance"
-    if any(k in term for k in ("セグメント", "KPI", "事業", "顧客", "戦略")):
+    if "business" in hits:
         return "Business"
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _pos(term: str) -> str:
     if re.fullmatch(r"[A-Za-z0-9]+", term):
         return "名詞"
@@ -393,31 +503,89 @@ def process_company_dir(company_dir: Path) -> dict:
             "notes": ["PDFが見つかりませんでした。"],
         }
 
-    counter: Counter[str] = Counter()
-    first_context: dict[str, str] = {}
+    accepted: list[str] = []
+    pages_all: list[str | None] = []
+    first_page: dict[str, int] = {}
+    # 同一企業内ではヘッダ・免責事項等のページが資料をまたいで一字一句同じで繰り返される。
+    # ページ本文のハッシュ→候補語リストをメモリに持ち、2回目以降はディスクキャッシュ参照すら省く
+    page_cache: dict[bytes, list[str]] = {}
     pdf_infos: list[PdfInfo] = []
     notes: list[str] = []
 
-    for pdf in pdfs:
-        pages_text, info = extract_pdf_pages_text(pdf)
-        pdf_infos.append(info)
-        if info.pages_with_text == 0:
-            notes.append(f"{pdf.name}: テキスト抽出できたページが0でした（スキャンPDFの可能性）。")
-            continue
-
-        for page_text in pages_text:
-            if not page_text:
-                continue
-            for raw_term in extract_candidates(page_text):
-                term = _nfkc(raw_term).strip()
-                term = term.strip("・-－‐/／")
-                if _looks_bad(term, company):
+    # PDFテキスト抽出はpdfminerがI/OやC実装部分でGILを手放すため、企業内のPDF単位で
+    # スレッド並列にする。企業単位のプロセス並列と重なるためワーカーは2に抑える。
+    # 抽出側は文書全体をリスト化せず、有界キュー経由で1ページずつメインスレッドへ渡す
+    # (メモリはキュー分で頭打ちになり、候補語抽出はPDF提出順に処理されるので
+    # 「最初に出現したページ」の決定性も保たれる)。
+    with ThreadPoolExecutor(max_workers=min(2, len(pdfs))) as pool:
+        cancel = threading.Event()
+
+        def _put(q: Queue, item: str | None) -> bool:
+            while not cancel.is_set():
+                try:
+                    q.put(item, timeout=0.5)
+                    return True
+                except Full:
                     continue
-                counter[term] += 1
-                if term not in first_context:
-                    ctx = _extract_context(page_text, term)
-                    if ctx:
-                        first_context[term] = ctx
+            return False
+
+        def _stream_pdf(pdf: Path, q: Queue) -> PdfInfo:
+            pages_total = 0
+            pages_with_text = 0
+            try:
+                for page_text in iter_pdf_pages_text(pdf):
+                    pages_total += 1
+                    if not page_text:
+                        continue
+                    pages_with_text += 1
+                    if not _put(q, page_text):
+                        break
+            finally:
+                _put(q, None)  # 終端
+            return PdfInfo(path=pdf, pages_total=pages_total, pages_with_text=pages_with_text)
+
+        extractions = [(pdf, Queue(maxsize=8)) for pdf in pdfs]
+        futures = [pool.submit(_stream_pdf, pdf, q) for pdf, q in extractions]
+        try:
+            for (pdf, q), future in zip(extractions, futures):
+                while True:
+                    page_text = q.get()
+                    if page_text is None:
+                        break
+                    # 出現回数は辞書インクリメントせず、採用語をリストに溜めて最後に
+                    # C実装のCounter(accepted)へ一括集計する
+                    page_hash = hashlib.blake2b(page_text.encode("utf-8"), digest_size=16).digest()
+                    candidates = page_cache.get(page_hash)
+                    if candidates is None:
+                        candidates = _cached_extract_candidates(page_text)
+                        page_cache[page_hash] = candidates
+                    page_terms = [
+                        term
+                        for term in (
+                            _nfkc(raw_term).strip().strip("・-－‐/／") for raw_term in candidates
+                        )
+                        if not _looks_bad(term, company)
+                    ]
+                    accepted.extend(page_terms)
+                    # 文脈抽出はtext.findを伴い高くつくので、ここでは初出ページ番号だけ控える。
+                    # どの語の初出ページでもないページは後段で参照されないため本文を保持しない。
+                    page_idx = len(pages_all)
+                    introduced = False
+                    for term in page_terms:
+                        if term not in first_page:
+                            first_page[term] = page_idx
+                            introduced = True
+                    pages_all.append(page_text if introduced else None)
+
+                info = future.result()
+                pdf_infos.append(info)
+                if info.pages_with_text == 0:
+                    notes.append(f"{pdf.name}: テキスト抽出できたページが0でした（スキャンPDFの可能性）。")
+        finally:
+            # 途中で例外が出た場合も、キュー待ちのワーカーを解放してからプールを閉じる
+            cancel.set()
+
+    counter = Counter(accepted)
 
     if len(counter) > MAX_TERMS_PER_COMPANY:
         cutoff_count = counter.most_common(MAX_TERMS_PER_COMPANY)[-1][1]
@@ -430,6 +598,17 @@ def process_company_dir(company_dir: Path) -> dict:
     terms_sorted = sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))
     top_terms = [t for t, _ in terms_sorted[:MAX_TERMS_PER_COMPANY]]
 
+    # 文脈は採用が確定した上位語についてのみ、初出ページから取得する
+    # (ユニーク候補全語に対してtext.findを走らせるのに比べ呼び出し数が桁で減る)
+    first_context: dict[str, str] = {}
+    for term in top_terms:
+        page_idx = first_page.get(term)
+        if page_idx is None:
+            continue
+        ctx = _extract_context(pages_all[page_idx], term)
+        if ctx:
+            first_context[term] = ctx
+
     entries = []
     for term in top_terms:
         entry = {
@@ -463,6 +642,34 @@ def process_company_dir(company_dir: Path) -> dict:
     }
 
 
+def _copy_pdf(src: Path, dst: Path) -> None:
+    """PDFを出力レイアウトへ配置する。
+
+    同一ファイルシステムならハードリンクで済ませ、数十MBの読み書きを丸ごと省く。
+    クロスデバイス等でリンクできない場合(Windowsの一部環境含む)は従来どおりコピーする。
+    """
+    dst.unlink(missing_ok=True)  # 前回実行の実体ファイルが残っているとos.linkが失敗する
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+# 新レイアウトとレガシーの2箇所へ同内容を書くため、1回のシリアライズで
+# 全ファイルへ流し込む(行リストを二重にメモリへ展開しない)
+def _write_lines_to_all(paths: Iterable[Path], lines: Iterable[str]) -> None:
+    with ExitStack() as stack:
+        files = [stack.enter_context(p.open("w", encoding="utf-8")) for p in paths]
+        for line in lines:
+            for f in files:
+                f.write(line)
+                f.write("\n")
+
+
+def _write_jsonl_to_all(paths: Iterable[Path], entries: Iterable[dict]) -> None:
+    _write_lines_to_all(paths, (json.dumps(e, ensure_ascii=False) for e in entries))
+
+
 def write_outputs(result: dict) -> None:
     company: str = result["company"]
     company_dirname = result.get("company_dir", company)
@@ -477,16 +684,12 @@ def write_outputs(result: dict) -> None:
         src = RESOURCES_DIR / company_dirname / pdf_name
         dst = company_out_dir / pdf_name
         if src.exists():
-            shutil.copy2(src, dst)
+            _copy_pdf(src, dst)
 
     out_txt_path = company_out_dir / "wordList" / "wordList.txt"
     out_jsonl_path = company_out_dir / "metadata" / "wordList.jsonl"
     out_log_path = company_out_dir / "worklog.md"
 
-    out_txt_path.write_text("\n".join(result["terms"]) + "\n", encoding="utf-8")
-    jsonl_lines = [json.dumps(e, ensure_ascii=False) for e in result["entries"]]
-    out_jsonl_path.write_text("\n".join(jsonl_lines) + "\n", encoding="utf-8")
-
     # Legacy layout (keep): wordList/<company>_wordList.(txt|jsonl), worklog/<company>_worklog.md
     WORDLIST_DIR.mkdir(parents=True, exist_ok=True)
     WORKLOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -494,8 +697,8 @@ def write_outputs(result: dict) -> None:
     legacy_jsonl_path = WORDLIST_DIR / f"{company}_wordList.jsonl"
     legacy_log_path = WORKLOG_DIR / f"{company}_worklog.md"
 
-    legacy_txt_path.write_text("\n".join(result["terms"]) + "\n", encoding="utf-8")
-    legacy_jsonl_path.write_text("\n".join(jsonl_lines) + "\n", encoding="utf-8")
+    _write_lines_to_all((out_txt_path, legacy_txt_path), result["terms"])
+    _write_jsonl_to_all((out_jsonl_path, legacy_jsonl_path), result["entries"])
 
     pdf_infos: list[PdfInfo] = result.get("pdf_infos", [])
     total_pages = sum(i.pages_total for i in pdf_infos)
@@ -535,11 +738,16 @@ def main() -> None:
     if not company_dirs:
         raise SystemExit(f"企業フォルダが見つかりません: {RESOURCES_DIR}")
 
-    for company_dir in company_dirs:
-        result = process_company_dir(company_dir)
-        result["company_dir"] = company_dir.name
-        write_outputs(result)
-        print(f"[OK] {result['company']}: {result.get('stats', {}).get('selected_terms', 0)} terms")
+    # 企業ごとの処理は完全に独立(入出力パスが重ならない)なので、プロセス並列で回す。
+    # PDF抽出とjanomeのトークナイズはCPUバウンドでGILを手放さないため、スレッドでは効かない。
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {executor.submit(process_company_dir, d): d for d in company_dirs}
+        for future in as_completed(futures):
+            company_dir = futures[future]
+            result = future.result()
+            result["company_dir"] = company_dir.name
+            write_outputs(result)
+            print(f"[OK] {result['company']}: {result.get('stats', {}).get('selected_terms', 0)} terms")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover
+    ahocorasick = None
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except Exception:  # pragma: no cover
+    pa = None
+
 
 ROOT_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = ROOT_DIR / "output"
@@ -41,25 +61,62 @@ FORM_TERMS = {
     "証券報告",
 }
 
-RE_EDINET_CODE = re.compile(r"E\d{5}")
-RE_HAS_BRACKETS = re.compile(r"[【】]")
-RE_ONLY_NUM_PUNCT = re.compile(r"^[\d,.\-–—/]+$")
-RE_FOOTNOTE = re.compile(r"^(?:\(\d+\)|\d+\))$")
-RE_DATE_FRAGMENT = re.compile(
-    r"(?:\d{4}年|\d{1,2}月\d{0,2}(?:日)?|\d{4}/\d{1,2}/\d{1,2}|\d{4}-\d{1,2}-\d{1,2})"
+# _is_noisy_word は語ごとに呼ばれるため、アンカー付き(語全体)の判定と部分一致の判定を
+# それぞれ1本の選択肢正規表現に束ね、正規表現エンジンへの往復を2回に抑える。
+# 数値+記号のみ / 脚注 / ページ分数 / 章番号 / 月日の断片
+RE_NOISE_FULLMATCH = re.compile(
+    r"(?:[\d,.\-–—/]+"
+    r"|\(\d+\)|\d+\)"
+    r"|\d+\s*/\s*\d+"
+    r"|第?\d+(?:章|節|項|期)|\d+(?:章|節|項)"
+    r"|月\d+(?:日)?|\d+月)"
+)
+# EDINETコード / 隅付き括弧 / 日付断片
+RE_NOISE_SEARCH = re.compile(
+    r"E\d{5}|[【】]|\d{4}年|\d{1,2}月\d{0,2}(?:日)?|\d{4}/\d{1,2}/\d{1,2}|\d{4}-\d{1,2}-\d{1,2}"
 )
-RE_MONTH_LEADING = re.compile(r"^月\d+(?:日)?$")
-RE_MONTH_TRAILING = re.compile(r"^\d+月$")
-RE_PAGE_FRACTION = re.compile(r"^\d+\s*/\s*\d+$")
-RE_SECTION = re.compile(r"^(?:第?\d+(?:章|節|項|期)|\d+(?:章|節|項))$")
 RE_UNIT_FRAGMENT = re.compile(r"(?:単位|百万円|千円|円|株|％|%|回|人|件|台|社|日|月|年)")
 RE_PARENS = re.compile(r"[()（）]")
 
+# 上記ノイズ判定のいずれかに引っかかり得る文字の集合。大半の語は純粋な日本語の用語で
+# これらを1文字も含まないため、まず1回の走査で「疑わしい文字なし→非ノイズ確定」に落とす
+RE_SUSPICIOUS_CHAR = re.compile(r"[0-9,.:/\-–—()（）【】EＥ月年日期章節項]")
+
+# 数字率の算出用: translateで数字を除いた長さとの差分を取る(文字ごとのisdigit呼び出しを避ける)
+_DIGIT_REMOVE = str.maketrans("", "", "0123456789")
+
 RE_PHONE = re.compile(r"\b0\d{1,4}-\d{1,4}-\d{3,4}\b")
 RE_ADDRESS_LIKE = re.compile(
     r"(?:東京都|北海道|(?:京都|大阪)府|.{2,3}県).*(?:市|区|町|村).*(?:丁目|番|号|\d{1,4}-\d{1,4})"
 )
 
+# 提出フォーム/表紙由来の固定文字列シグナル。個別のin判定(8回の走査)の代わりに
+# Aho-Corasickオートマトンで1回の走査にまとめる(pyahocorasick不在時は選択肢正規表現)
+_DESC_NOISE_MARKERS = (
+    "EDINET提出書類",
+    "【表紙】",
+    "【提出",
+    "財務局長",
+    "電話番号",
+    "【会社名】",
+    "【英訳名】",
+    "【代表者",
+)
+
+
+def _build_desc_noise_matcher():
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for marker in _DESC_NOISE_MARKERS:
+            automaton.add_word(marker, marker)
+        automaton.make_automaton()
+        return lambda d: next(automaton.iter(d), None) is not None
+    pattern = re.compile("|".join(map(re.escape, _DESC_NOISE_MARKERS)))
+    return lambda d: pattern.search(d) is not None
+
+
+_desc_noise_hit = _build_desc_noise_matcher()
+
 
 @dataclass(frozen=True)
 class FixStats:
@@ -75,64 +132,56 @@ def _now_local() -> str:
     return datetime.now().astimezone().isoformat(timespec="seconds")
 
 
+# 企業ディレクトリ名「<番号>_<会社名>」のパターン(呼び出しごとのコンパイルを避ける)
+_RE_COMPANY_DIR = re.compile(r"^\d+_(.+)$")
+
+
 def _company_name_from_dirname(dirname: str) -> str:
-    m = re.match(r"^\d+_(.+)$", dirname)
+    m = _RE_COMPANY_DIR.match(dirname)
     return m.group(1) if m else dirname
 
 
-def _is_noisy_word(word: str, company: str) -> bool:
+def _is_noisy_word(word: str, noise_exact: frozenset[str]) -> bool:
+    """noise_exact は FORM_TERMS ∪ GENERIC_STOPWORDS ∪ {会社名} を企業ごとに1回だけ束ねたもの。
+
+    完全一致のノイズ語は正規表現に入る前にハッシュ1回で落とす。
+    """
     w = word.strip()
     if not w:
         return True
+    return _is_noisy_word_cached(w, noise_exact)
 
-    if w in FORM_TERMS:
-        return True
-
-    if w in GENERIC_STOPWORDS:
-        return True
 
-    if RE_EDINET_CODE.search(w):
+# 同じ語はwordList内・企業間で何度も現れるため判定結果をメモ化する。
+# キャッシュヒットは正規表現一式の代わりに辞書参照1回で済む
+@functools.lru_cache(maxsize=200_000)
+def _is_noisy_word_cached(w: str, noise_exact: frozenset[str]) -> bool:
+    if w in noise_exact:
         return True
 
-    if RE_HAS_BRACKETS.search(w):
-        return True
-
-    if RE_ONLY_NUM_PUNCT.fullmatch(w):
-        return True
-
-    if RE_FOOTNOTE.fullmatch(w):
-        return True
-
-    if RE_PAGE_FRACTION.fullmatch(w):
-        return True
+    # 疑わしい文字を含まない語はどの正規表現にもマッチし得ないため、ここで打ち切る
+    if not RE_SUSPICIOUS_CHAR.search(w):
+        return False
 
-    if RE_SECTION.fullmatch(w):
+    if RE_NOISE_FULLMATCH.fullmatch(w):
         return True
 
-    if RE_DATE_FRAGMENT.search(w):
+    if RE_NOISE_SEARCH.search(w):
         return True
 
-    if RE_MONTH_LEADING.fullmatch(w) or RE_MONTH_TRAILING.fullmatch(w):
-        return True
-
-    # 括弧の片割れだけ残る断片を除去（例: "(新規公開"）
-    if ("(" in w or ")" in w or "（" in w or "）" in w) and (
-        w.count("(") != w.count(")") or w.count("（") != w.count("）")
-    ):
-        return True
-
-    # 単位や注記の断片（括弧付き/末尾括弧など）は原則ノイズ
-    if RE_PARENS.search(w) and RE_UNIT_FRAGMENT.search(w):
-        return True
-    if (w.endswith(")") or w.endswith("）")) and RE_UNIT_FRAGMENT.search(w):
-        return True
+    # 括弧まわりの判定は、まず括弧の有無だけ1回調べ、含む語(少数派)に限って数える
+    # (従来は括弧なしの語にも4回のcount全文走査が走っていた)
+    if RE_PARENS.search(w):
+        counts = Counter(ch for ch in w if ch in "()（）")
+        # 括弧の片割れだけ残る断片を除去（例: "(新規公開"）
+        if counts["("] != counts[")"] or counts["（"] != counts["）"]:
+            return True
+        # 単位や注記の断片（括弧付き/末尾括弧など）は原則ノイズ
+        if RE_UNIT_FRAGMENT.search(w):
+            return True
     if w.endswith(":") and "単位" in w:
         return True
 
-    # 会社名そのものは削除（再利用性が低い）
-    if w == company:
-        return True
-
     return False
 
 
@@ -142,21 +191,17 @@ def _is_noisy_description(desc: str) -> bool:
         return True
 
     # 提出フォーム/表紙由来の強いシグナル
-    if "EDINET提出書類" in d or "【表紙】" in d or "【提出" in d:
-        return True
-    if "財務局長" in d or "電話番号" in d:
+    if _desc_noise_hit(d):
         return True
     if RE_PHONE.search(d):
         return True
-    if "【会社名】" in d or "【英訳名】" in d or "【代表者" in d:
-        return True
 
     # 住所っぽい記述（用語の説明ではない）
     if RE_ADDRESS_LIKE.search(d):
         return True
 
     # 数字・記号だらけの断片
-    digits = sum(ch.isdigit() for ch in d)
+    digits = len(d) - len(d.translate(_DIGIT_REMOVE))
     if digits / max(1, len(d)) > 0.35 and len(d) < 120:
         return True
 
@@ -167,6 +212,44 @@ def _is_noisy_description(desc: str) -> bool:
     return False
 
 
+# pyarrowの一括判定が割に合う語数の目安(少数ならPythonループのままで十分)
+_ARROW_MIN_WORDS = 20_000
+
+
+def _filter_keep_words(words_in: list[str], noise_exact: frozenset[str]) -> list[str]:
+    """ノイズ語を除き、出現順を保った重複排除済みリストを返す。
+
+    pyarrowがあり語数が多い場合は「完全一致ノイズ」と「疑わしい文字を含まない→
+    クリーン確定」の大多数をC++カーネルで一括判定し、残る少数だけを
+    _is_noisy_word の正規表現判定に回す(括弧の対応などはArrowカーネルで表現
+    できないため、判定ルール自体はPython側に一本化したまま)。
+    """
+    if pa is not None and len(words_in) >= _ARROW_MIN_WORDS:
+        arr = pa.array(words_in, type=pa.string())
+        exact_noisy = pc.is_in(arr, value_set=pa.array(sorted(noise_exact))).to_pylist()
+        suspicious = pc.match_substring_regex(arr, RE_SUSPICIOUS_CHAR.pattern).to_pylist()
+    else:
+        exact_noisy = suspicious = None
+
+    keep_words: list[str] = []
+    seen = set()
+    for i, w in enumerate(words_in):
+        if exact_noisy is not None:
+            if exact_noisy[i]:
+                continue
+            if suspicious[i] and _is_noisy_word(w, noise_exact):
+                continue
+        elif _is_noisy_word(w, noise_exact):
+            continue
+        # internしておくと、後段のkeep_set照合が同一オブジェクトのポインタ比較で済む
+        w = sys.intern(w)
+        if w in seen:
+            continue
+        seen.add(w)
+        keep_words.append(w)
+    return keep_words
+
+
 def _load_words(wordlist_path: Path) -> list[str]:
     return [
         line.strip()
@@ -176,22 +259,33 @@ def _load_words(wordlist_path: Path) -> list[str]:
 
 
 def _write_words(wordlist_path: Path, words: list[str]) -> None:
-    wordlist_path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    # テキスト層(TextIOWrapper)のエンコードを経由せず、一括エンコードしてバイナリで1回書く
+    wordlist_path.write_bytes(("\n".join(words) + "\n").encode("utf-8"))
 
 
 def _load_jsonl(jsonl_path: Path) -> list[dict]:
-    items: list[dict] = []
-    for line in jsonl_path.read_text(encoding="utf-8").splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        items.append(json.loads(s))
-    return items
+    # 全体をbytesで読み切って改行でsplitする。テキスト層のUTF-8デコードを挟まず、
+    # バッファ付きハンドルの行イテレーションより1ファイル1回のreadで済む。
+    # orjson(Rust実装)があれば行パースを数倍速にできる(json.loadsもbytesを受けるので共通コード)
+    loads = json.loads if orjson is None else orjson.loads
+    data = jsonl_path.read_bytes()
+    return [loads(line) for line in data.split(b"\n") if line.strip()]
 
 
 def _write_jsonl(jsonl_path: Path, items: list[dict]) -> None:
-    lines = [json.dumps(item, ensure_ascii=False) for item in items]
-    jsonl_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # 各行をbytesのままbytearrayに蓄積し、書き込みはシステムコール1回にまとめる。
+    # orjsonはUTF-8のbytesを直接返すため、テキスト層のエンコードも省ける
+    buf = bytearray()
+    if orjson is not None:
+        for item in items:
+            buf += orjson.dumps(item)
+            buf += b"\n"
+    else:
+        dumps = json.dumps
+        for item in items:
+            buf += dumps(item, ensure_ascii=False).encode("utf-8")
+            buf += b"\n"
+    jsonl_path.write_bytes(buf)
 
 
 def microfix_company(company_out_dir: Path) -> FixStats:
@@ -205,54 +299,49 @@ def microfix_company(company_out_dir: Path) -> FixStats:
     if not jsonl_path.exists():
         raise FileNotFoundError(jsonl_path)
 
+    # 会社名そのものも再利用性が低いため完全一致ノイズに含める
+    noise_exact = frozenset().union(FORM_TERMS, GENERIC_STOPWORDS, (company,))
+
     words_in = _load_words(wordlist_path)
-    keep_words: list[str] = []
-    seen = set()
-    for w in words_in:
-        if _is_noisy_word(w, company):
-            continue
-        if w in seen:
-            continue
-        seen.add(w)
-        keep_words.append(w)
+    keep_words = _filter_keep_words(words_in, noise_exact)
 
     items_in = _load_jsonl(jsonl_path)
-    items_out: list[dict] = []
     desc_dropped = 0
 
+    # keep_setはinternされた文字列の集合で高々数万件(ハッシュ表ごとL2に収まる規模)。
+    # Bloomフィルタ等の確率的プリフィルタをPythonレベルで前置しても、set照合1回より
+    # 高くつくだけなので置かない
     keep_set = set(keep_words)
-    for item in items_in:
-        word = (item.get("word") or "").strip()
-        if not word or word not in keep_set:
+    # フィルタ・description除去・word単位の重複排除（同一wordは最初の1件のみ採用）を
+    # 1パスで行い、あとはwordList順に並べ直すだけにする。
+    # wordの正規化はここで (word, item) の組に切り出し、ループ本体はキーだけを見る
+    items_norm = (
+        (sys.intern((item.get("word") or "").strip()), item) for item in items_in
+    )
+    by_word: dict[str, dict] = {}
+    for word, item in items_norm:
+        if not word or word not in keep_set or word in by_word:
             continue
         desc = item.get("description")
         if isinstance(desc, str) and _is_noisy_description(desc):
-            item = dict(item)
-            item.pop("description", None)
+            # dict(item)+popの2段階より、descriptionを除いた内包表記1回で作る方が速い
+            item = {k: v for k, v in item.items() if k != "description"}
             desc_dropped += 1
-        items_out.append(item)
+        by_word[word] = item
 
-    # jsonl の順序を wordList に揃える（同一wordは最初の1件のみ採用）
-    by_word: dict[str, dict] = {}
-    for item in items_out:
-        w = item["word"]
-        if w not in by_word:
-            by_word[w] = item
     items_out_ordered = [by_word[w] for w in keep_words if w in by_word]
 
     _write_words(wordlist_path, keep_words)
     _write_jsonl(jsonl_path, items_out_ordered)
 
-    # worklog に追記（存在しない場合は新規作成）
+    # worklog に追記（存在しない場合は新規作成）。
+    # 既存ログ全体を読み直して書き戻すのではなく、追記モードで新セクションだけ書く
     removed = len(words_in) - len(keep_words)
-    log_lines = []
-    if worklog_path.exists():
-        log_lines.append(worklog_path.read_text(encoding="utf-8").rstrip())
-        log_lines.append("")
-    else:
-        log_lines.append(f"# 作業ログ: {company}")
-        log_lines.append("")
+    if not worklog_path.exists():
+        worklog_path.write_text(f"# 作業ログ: {company}\n", encoding="utf-8")
 
+    log_lines = []
+    log_lines.append("")
     log_lines.append("## 微修正（バリ取り）")
     log_lines.append(f"- 実行日時: {_now_local()}")
     log_lines.append("- 対象: `wordList/wordList.txt`, `metadata/wordList.jsonl`")
@@ -262,8 +351,9 @@ def microfix_company(company_out_dir: Path) -> FixStats:
     log_lines.append(
         "- ルール要旨: EDINET/提出フォーム/EDINETコード/日付断片/脚注/単位断片/汎用語/会社名そのものを除去"
     )
-    log_lines.append("")
-    worklog_path.write_text("\n".join(log_lines) + "\n", encoding="utf-8")
+    # 区切りの空行はセクション先頭側だけに置く(末尾にも置くと追記のたびに空行が増える)
+    with worklog_path.open("a", encoding="utf-8") as f:
+        f.write("\n".join(log_lines) + "\n")
 
     return FixStats(
         words_in=len(words_in),
@@ -285,14 +375,16 @@ def main() -> None:
 
     total_words_in = total_words_out = 0
     total_desc_dropped = 0
-    for d in company_dirs:
-        stats = microfix_company(d)
-        total_words_in += stats.words_in
-        total_words_out += stats.words_out
-        total_desc_dropped += stats.desc_dropped
-        print(
-            f"[OK] {d.name}: words {stats.words_in}->{stats.words_out}, jsonl {stats.jsonl_in}->{stats.jsonl_out}, desc_drop {stats.desc_dropped}"
-        )
+    # 企業ごとの微修正は完全に独立(別ファイル・共有状態なし)なのでプロセス並列で回す。
+    # ex.mapは入力順に結果を返すため、ログの出力順も従来どおり
+    with ProcessPoolExecutor() as executor:
+        for d, stats in zip(company_dirs, executor.map(microfix_company, company_dirs)):
+            total_words_in += stats.words_in
+            total_words_out += stats.words_out
+            total_desc_dropped += stats.desc_dropped
+            print(
+                f"[OK] {d.name}: words {stats.words_in}->{stats.words_out}, jsonl {stats.jsonl_in}->{stats.jsonl_out}, desc_drop {stats.desc_dropped}"
+            )
 
     print(
         f"[DONE] companies={len(company_dirs)}, words_total {total_words_in}->{total_words_out}, desc_drop_total={total_desc_dropped}"